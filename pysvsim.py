@@ -7,12 +7,11 @@ modules and generates truth tables. Supports testing with JSON test cases.
 
 Usage:
     python pysvsim.py --file <verilog_file> [--test <json_file>] [--max-combinations N]
-    python pysvsim.py <file_or_folder> [--sequential] [--workers N]
+    python pysvsim.py <file_or_folder> [--sequential] [--workers/--jobs N]
 """
 
 import argparse
-import contextlib
-import io
+import hashlib
 import json
 import multiprocessing
 import os
@@ -21,14 +20,47 @@ import sys
 import time
 import traceback
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from itertools import product
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterable, List, Set, Tuple, Any, Optional, Union
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
 
 # Global module cache to prevent repeated parsing of the same modules
 GLOBAL_MODULE_CACHE = {}
+# Source mtimes of cached modules and the directory their names were resolved from
+_MODULE_CACHE_MTIMES: Dict[str, int] = {}
+_MODULE_CACHE_DIR: Optional[str] = None
+# (module name, search paths) lookups that failed while testing the current
+# file, so their warning is printed once rather than again by every later
+# pass over the hierarchy
+_MODULE_LOOKUP_FAILURES: Set[Tuple[str, Tuple[str, ...]]] = set()
+# Hierarchy lookups served from GLOBAL_MODULE_CACHE vs. ones that had to parse
+MODULE_CACHE_STATS = {"hits": 0, "misses": 0}
+# Parsed module info keyed by (absolute path, mtime_ns, size) of the source file
+_PARSE_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+# Parser reused for every parse in this process (each worker gets its own);
+# parse_file() resets its state, so one instance serves every file
+_SHARED_PARSER: Optional["SystemVerilogParser"] = None
+# Decoded JSON test files keyed by a hash of their bytes, so identical test
+# files are only decoded once per process. Loaded tests are treated read-only.
+_TEST_JSON_CACHE: Dict[bytes, Any] = {}
+# Decoded JSON test files keyed by (absolute path, mtime_ns, size); a hit skips
+# reading the file at all
+_TEST_JSON_STAT_CACHE: Dict[Tuple[str, int, int], Any] = {}
+# Case-folded directory listings keyed by absolute directory, with the mtime_ns
+# they were read at; adding or removing a file changes the directory mtime and
+# so invalidates them
+_DIR_LISTING_CACHE: Dict[str, Tuple[int, frozenset]] = {}
+
+# Directory (relative to the working directory) for the optional on-disk result cache
+DEFAULT_CACHE_DIR = ".pysvsim_cache"
+# Measured per-file execution times kept in the cache directory for scheduling
+FILE_COSTS_NAME = "file_costs.json"
+# Test files looked up next to "<name>.sv", in priority order
+JSON_TEST_SUFFIXES = (".json", "_test.json", "_tests.json")
+_SIMULATOR_FINGERPRINT: Optional[bytes] = None
 
 
 def parse_sv_range(range_expr: str) -> Tuple[int, int, int]:
@@ -165,8 +197,71 @@ def normalize_memory_bindings(test_data: Any, test_dir: str, default_module: str
 
 def clear_module_cache():
     """Clear the global module cache. Useful for testing or when modules change."""
-    global GLOBAL_MODULE_CACHE
+    _clear_module_name_cache()
+    _PARSE_CACHE.clear()
+
+
+def _clear_module_name_cache():
+    """Forget name -> module resolutions but keep parsed files for reuse."""
+    global GLOBAL_MODULE_CACHE, _MODULE_CACHE_DIR
     GLOBAL_MODULE_CACHE.clear()
+    _MODULE_CACHE_MTIMES.clear()
+    _MODULE_LOOKUP_FAILURES.clear()
+    _MODULE_CACHE_DIR = None
+
+
+def parse_file_cached(
+    filepath: str, parser: Optional["SystemVerilogParser"] = None
+) -> Dict[str, Any]:
+    """Parse a SystemVerilog file, reusing the result while the file is unchanged.
+
+    The returned module info is shared between callers and must not be mutated.
+    Without an explicit parser, the process-wide shared parser is used.
+    """
+    global _SHARED_PARSER
+    if parser is None:
+        if _SHARED_PARSER is None:
+            _SHARED_PARSER = SystemVerilogParser()
+        parser = _SHARED_PARSER
+
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        # Let the parser raise its usual error for missing/unreadable files
+        return parser.parse_file(filepath)
+
+    key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+    module_info = _PARSE_CACHE.get(key)
+    if module_info is None:
+        module_info = parser.parse_file(filepath)
+        _PARSE_CACHE[key] = module_info
+    return module_info
+
+
+def prepare_module_cache(sv_file: str):
+    """Keep cached sub-modules that are still valid for testing ``sv_file``.
+
+    Module names resolve relative to the top-level file's directory, so the
+    cache is only reused between files in the same directory. Entries whose
+    source file changed on disk since they were parsed are dropped.
+    """
+    global _MODULE_CACHE_DIR
+    # Missing sub-modules are looked up (and reported) again for each file
+    _MODULE_LOOKUP_FAILURES.clear()
+    directory = os.path.dirname(os.path.abspath(sv_file))
+    if directory != _MODULE_CACHE_DIR:
+        _clear_module_name_cache()
+        _MODULE_CACHE_DIR = directory
+        return
+
+    for module_name, mtime_ns in list(_MODULE_CACHE_MTIMES.items()):
+        try:
+            current = os.stat(GLOBAL_MODULE_CACHE[module_name]["filepath"]).st_mtime_ns
+        except (KeyError, OSError):
+            current = None
+        if current != mtime_ns:
+            GLOBAL_MODULE_CACHE.pop(module_name, None)
+            del _MODULE_CACHE_MTIMES[module_name]
 
 
 class SystemVerilogParser:
@@ -349,7 +444,7 @@ class SystemVerilogParser:
             width = abs(msb - lsb) + 1
 
             # Parse signal names
-            names = [name.strip() for name in port_names.split(",") if name.strip()]
+            names = [sys.intern(name.strip()) for name in port_names.split(",") if name.strip()]
 
             for port_name in names:
                 self.bus_info[port_name] = {"msb": msb, "lsb": lsb, "width": width}
@@ -360,7 +455,7 @@ class SystemVerilogParser:
                     self.outputs.append(port_name)
         else:
             # Single-bit declarations
-            names = [name.strip() for name in section.split(",") if name.strip()]
+            names = [sys.intern(name.strip()) for name in section.split(",") if name.strip()]
 
             for port_name in names:
                 if port_name not in self.bus_info:
@@ -868,6 +963,18 @@ class SystemVerilogParser:
         return before_ok and after_ok
 
 
+# Expression patterns used on every evaluation, compiled once rather than looked
+# up in the re module's cache on each call. _IDENTIFIER_PATTERN matches whole
+# identifiers, the same spans \b<name>\b would.
+_IDENTIFIER_PATTERN = re.compile(r"\b[A-Za-z_]\w*")
+_MEMORY_ACCESS_PATTERN = re.compile(r"(\w+)\[([^\[\]:]+)\]")  # mem[address]
+_BUS_SLICE_PATTERN = re.compile(r"(\w+)\[(\d+):(\d+)\]")  # A[7:0]
+_BIT_SELECT_PATTERN = re.compile(r"(\w+)\[(\d+)\]")  # A[2]
+_SIZED_LITERAL_PATTERN = re.compile(r"(\d+)'([bhdBHD])([0-9a-fA-F_xXzZ]+)")  # 8'hFF
+_LOGICAL_NOT_PATTERN = re.compile(r"(?<![=!<>])!(?!=)")
+_DECIMAL_PATTERN = re.compile(r"\d+")
+
+
 class LogicEvaluator:
     """Evaluates SystemVerilog expressions with given input values."""
 
@@ -1310,8 +1417,6 @@ class LogicEvaluator:
             return self._evaluate_concatenation(eval_expr, signal_values)
 
         # Handle memory reads like mem[address]
-        memory_access_pattern = r"(\w+)\[([^\[\]:]+)\]"
-
         def replace_memory_access(match):
             memory_name = match.group(1)
             index_expr = match.group(2).strip()
@@ -1327,10 +1432,9 @@ class LogicEvaluator:
             index_value = max(0, min(len(memory_data) - 1, int(index_value)))
             return str(memory_data[index_value])
 
-        eval_expr = re.sub(memory_access_pattern, replace_memory_access, eval_expr)
+        eval_expr = _MEMORY_ACCESS_PATTERN.sub(replace_memory_access, eval_expr)
 
         # Handle bus slice expressions like A[7:0], in[15:8] first
-        bus_slice_pattern = r"(\w+)\[(\d+):(\d+)\]"
 
         def replace_bus_slice(match):
             bus_name = match.group(1)
@@ -1348,10 +1452,9 @@ class LogicEvaluator:
                 return str(slice_value)
             return match.group(0)  # Return original if not found
 
-        eval_expr = re.sub(bus_slice_pattern, replace_bus_slice, eval_expr)
+        eval_expr = _BUS_SLICE_PATTERN.sub(replace_bus_slice, eval_expr)
 
         # Handle single bus bit selection like A[2], B[0]
-        bit_select_pattern = r"(\w+)\[(\d+)\]"
 
         def replace_bit_select(match):
             bus_name = match.group(1)
@@ -1361,10 +1464,9 @@ class LogicEvaluator:
                 return str(signal_values[bit_signal])
             return match.group(0)  # Return original if not found
 
-        eval_expr = re.sub(bit_select_pattern, replace_bit_select, eval_expr)
+        eval_expr = _BIT_SELECT_PATTERN.sub(replace_bit_select, eval_expr)
 
         # Replace SystemVerilog literal constants
-        literal_pattern = r"(\d+)'([bhdBHD])([0-9a-fA-F_xXzZ]+)"
 
         def replace_literal(match):
             width = int(match.group(1))
@@ -1378,14 +1480,17 @@ class LogicEvaluator:
                 value = int(value_str, 10)
             return str(value & ((1 << width) - 1))
 
-        eval_expr = re.sub(literal_pattern, replace_literal, eval_expr)
+        eval_expr = _SIZED_LITERAL_PATTERN.sub(replace_literal, eval_expr)
 
-        # Replace identifiers with current values
-        for signal_name, value in signal_values.items():
-            if "[" not in signal_name:
-                eval_expr = re.sub(
-                    r"\b" + re.escape(signal_name) + r"\b", str(value), eval_expr
-                )
+        # Replace identifiers with current values in a single pass over the
+        # expression, rather than one regex substitution per known signal
+        def replace_identifier(match):
+            name = match.group(0)
+            if name in signal_values:
+                return str(signal_values[name])
+            return name
+
+        eval_expr = _IDENTIFIER_PATTERN.sub(replace_identifier, eval_expr)
 
         # Convert ternary operator (after slices/literals are resolved, so : is unambiguous)
         if "?" in eval_expr:
@@ -1416,7 +1521,7 @@ class LogicEvaluator:
         # Logical operators
         expression = expression.replace("&&", " and ")
         expression = expression.replace("||", " or ")
-        expression = re.sub(r"(?<![=!<>])!(?!=)", " not ", expression)
+        expression = _LOGICAL_NOT_PATTERN.sub(" not ", expression)
 
         return expression
 
@@ -1661,7 +1766,7 @@ class LogicEvaluator:
         for port_name, signal_name in connections.items():
             if port_name in module_info["outputs"]:
                 # Check if it's a bus slice assignment like outSum[3:0]
-                bus_slice_match = re.match(r"(\w+)\[(\d+):(\d+)\]", signal_name)
+                bus_slice_match = _BUS_SLICE_PATTERN.match(signal_name)
                 if bus_slice_match:
                     bus_name = bus_slice_match.group(1)
                     msb = int(bus_slice_match.group(2))
@@ -1695,7 +1800,7 @@ class LogicEvaluator:
                     signal_values[signal_name] = inst_outputs[port_name]
 
                     # Also handle bit selection assignment like Sum[0]
-                    bit_select_match = re.match(r"(\w+)\[(\d+)\]", signal_name)
+                    bit_select_match = _BIT_SELECT_PATTERN.match(signal_name)
                     if bit_select_match:
                         bus_name = bit_select_match.group(1)
                         bit_index = int(bit_select_match.group(2))
@@ -1707,7 +1812,7 @@ class LogicEvaluator:
         signal_name = signal_name.strip()
 
         # SystemVerilog literal
-        literal_match = re.match(r"(\d+)'([bhdBHD])([0-9a-fA-F_xXzZ]+)$", signal_name)
+        literal_match = "'" in signal_name and _SIZED_LITERAL_PATTERN.fullmatch(signal_name)
         if literal_match:
             width = int(literal_match.group(1))
             base = literal_match.group(2).lower()
@@ -1724,7 +1829,7 @@ class LogicEvaluator:
             return signal_values[signal_name]
 
         # Bus slice
-        bus_slice_match = re.match(r"(\w+)\[(\d+):(\d+)\]$", signal_name)
+        bus_slice_match = _BUS_SLICE_PATTERN.fullmatch(signal_name)
         if bus_slice_match:
             bus_name = bus_slice_match.group(1)
             msb = int(bus_slice_match.group(2))
@@ -1737,7 +1842,7 @@ class LogicEvaluator:
                 return (bus_value >> shift) & mask
 
         # Bit select
-        bit_select_match = re.match(r"(\w+)\[(\d+)\]$", signal_name)
+        bit_select_match = _BIT_SELECT_PATTERN.fullmatch(signal_name)
         if bit_select_match:
             bus_name = bit_select_match.group(1)
             bit_index = int(bit_select_match.group(2))
@@ -1748,7 +1853,7 @@ class LogicEvaluator:
                 return (signal_values[bus_name] >> bit_index) & 1
 
         # Numeric literal without width
-        if re.fullmatch(r"\d+", signal_name):
+        if _DECIMAL_PATTERN.fullmatch(signal_name):
             return int(signal_name)
 
         return None
@@ -1792,13 +1897,37 @@ class LogicEvaluator:
 
     def count_nand_gates(self) -> int:
         """Count the total number of NAND gates in the module hierarchy."""
-        return self._count_nand_gates_recursive("top_module", set())
+        # The top module is walked from this evaluator rather than stored in
+        # GLOBAL_MODULE_CACHE, where it would leak into the next file's count.
+        visited = {"top_module"}
+        resolved: set = set()
+        counts: Dict[str, int] = {}
+        return sum(
+            self._count_nand_gates_recursive(
+                inst["module_type"], visited.copy(), resolved, counts
+            )
+            for inst in self.instantiations
+        )
 
-    def _count_nand_gates_recursive(self, module_name: str, visited: set) -> int:
-        """Recursively count NAND gates in a module and its sub-modules."""
+    def _count_nand_gates_recursive(
+        self,
+        module_name: str,
+        visited: set,
+        resolved: Optional[set] = None,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """Recursively count NAND gates in a module and its sub-modules.
+
+        ``resolved`` collects module names already looked up during this count
+        so cache statistics see each distinct module once. ``counts`` memoizes
+        finished sub-module totals so a module instantiated many times (e.g. a
+        full adder in a wide adder) is only walked once.
+        """
         # Avoid infinite recursion
         if module_name in visited:
             return 0
+        if counts is not None and module_name in counts:
+            return counts[module_name]
         visited.add(module_name)
 
         # Check if this is the primitive NAND gate
@@ -1806,17 +1935,16 @@ class LogicEvaluator:
             return 1
 
         # Load module if not already loaded
-        if module_name not in GLOBAL_MODULE_CACHE:
-            # For the top module, use current module info
-            if module_name == "top_module":
-                # Create a temporary module info from current evaluator
-                temp_module_info = {
-                    "name": "top_module",
-                    "instantiations": self.instantiations,
-                }
-                GLOBAL_MODULE_CACHE[module_name] = temp_module_info
-            else:
-                self._load_module(module_name)
+        first_lookup = resolved is not None and module_name not in resolved
+        if first_lookup:
+            resolved.add(module_name)
+        if module_name in GLOBAL_MODULE_CACHE:
+            if first_lookup:
+                MODULE_CACHE_STATS["hits"] += 1
+        else:
+            if first_lookup:
+                MODULE_CACHE_STATS["misses"] += 1
+            self._load_module(module_name)
 
         if module_name not in GLOBAL_MODULE_CACHE:
             return 0
@@ -1828,10 +1956,12 @@ class LogicEvaluator:
         for inst in module_info.get("instantiations", []):
             sub_module_type = inst["module_type"]
             sub_nands = self._count_nand_gates_recursive(
-                sub_module_type, visited.copy()
+                sub_module_type, visited.copy(), resolved, counts
             )
             total_nands += sub_nands
 
+        if counts is not None:
+            counts[module_name] = total_nands
         return total_nands
 
     def _module_search_paths(self, module_name: str) -> List[str]:
@@ -1855,19 +1985,24 @@ class LogicEvaluator:
     def _load_module(self, module_name: str):
         """Load a module from disk using the current source file as context."""
         search_paths = self._module_search_paths(module_name)
+        lookup = (module_name, tuple(search_paths))
+        if lookup in _MODULE_LOOKUP_FAILURES:
+            return
         module_file = next((path for path in search_paths if os.path.exists(path)), None)
 
         if module_file is None:
+            _MODULE_LOOKUP_FAILURES.add(lookup)
             print(
                 f"Warning: Module '{module_name}' not found. Searched: {search_paths}"
             )
             return
 
         try:
-            parser = SystemVerilogParser()
-            module_info = parser.parse_file(module_file)
+            module_info = parse_file_cached(module_file)
             GLOBAL_MODULE_CACHE[module_name] = module_info
+            _MODULE_CACHE_MTIMES[module_name] = os.stat(module_file).st_mtime_ns
         except Exception as e:
+            _MODULE_LOOKUP_FAILURES.add(lookup)
             print(f"Warning: Could not load module '{module_name}': {e}")
 
 
@@ -2229,13 +2364,14 @@ class SequentialLogicEvaluator:
         return result
 
 
+# Sub-module names containing "reg" (register, regfile, ...) mark a design as sequential
+_SEQUENTIAL_SUBMODULE_HINT = re.compile("reg", re.IGNORECASE)
+
+
 def _has_sequential_submodules(module_info: Dict[str, Any]) -> bool:
     """Check if any instantiated sub-modules appear to be sequential (registers)."""
-    for inst in module_info.get("instantiations", []):
-        module_type = inst["module_type"].lower()
-        if "register" in module_type or "reg" in module_type:
-            return True
-    return False
+    search = _SEQUENTIAL_SUBMODULE_HINT.search
+    return any(search(inst["module_type"]) for inst in module_info.get("instantiations", []))
 
 
 def create_evaluator(
@@ -2259,56 +2395,131 @@ def create_evaluator(
     Returns:
         A LogicEvaluator or SequentialLogicEvaluator instance.
     """
-    is_sequential = bool(
-        module_info.get("sequential_blocks") or module_info.get("clock_signals")
-    )
+    # Read each optional field once; both evaluator types share most of them.
+    get = module_info.get
+    sequential_blocks = get("sequential_blocks", [])
+    clock_signals = get("clock_signals", [])
+    is_sequential = bool(sequential_blocks or clock_signals)
     if not is_sequential and check_submodules:
         is_sequential = _has_sequential_submodules(module_info)
 
-    resolved_name = module_name or module_info.get("name", "")
-    source_path = filepath or module_info.get("filepath", "")
+    resolved_name = module_name or get("name", "")
+    source_path = filepath or get("filepath", "")
+    common_fields = (
+        module_info["inputs"],
+        module_info["outputs"],
+        module_info["assignments"],
+        get("instantiations", []),
+        get("bus_info", {}),
+        get("slice_assignments", []),
+        get("concat_assignments", []),
+    )
+    memory_arrays = get("memory_arrays", {})
+    combinational_blocks = get("combinational_blocks", [])
 
     if is_sequential:
         return SequentialLogicEvaluator(
-            module_info["inputs"],
-            module_info["outputs"],
-            module_info["assignments"],
-            module_info.get("instantiations", []),
-            module_info.get("bus_info", {}),
-            module_info.get("slice_assignments", []),
-            module_info.get("concat_assignments", []),
-            module_info.get("sequential_blocks", []),
-            module_info.get("clock_signals", []),
+            *common_fields,
+            sequential_blocks,
+            clock_signals,
             source_path,
-            module_info.get("memory_arrays", {}),
+            memory_arrays,
             resolved_name,
             instance_path,
             memory_bindings or [],
-            module_info.get("combinational_blocks", []),
+            combinational_blocks,
         )
 
     return LogicEvaluator(
-        module_info["inputs"],
-        module_info["outputs"],
-        module_info["assignments"],
-        module_info.get("instantiations", []),
-        module_info.get("bus_info", {}),
-        module_info.get("slice_assignments", []),
-        module_info.get("concat_assignments", []),
+        *common_fields,
         source_path,
-        module_info.get("memory_arrays", {}),
+        memory_arrays,
         resolved_name,
         instance_path,
         memory_bindings or [],
-        module_info.get("combinational_blocks", []),
+        combinational_blocks,
+    )
+
+
+@lru_cache(maxsize=None)
+def _truth_table_layout(
+    input_headers: Tuple[str, ...], output_headers: Tuple[str, ...]
+) -> Tuple[str, str]:
+    """Header block and row format string for a truth table with these columns.
+
+    Cached because many files share an interface (same port names and widths).
+    """
+    header_inputs = " ".join(f"{header:>6}" for header in input_headers)
+    header_outputs = " ".join(f"{header:>6}" for header in output_headers)
+    header = "\n".join(
+        [
+            "Truth Table:",
+            f"{header_inputs} | {header_outputs}",
+            "-" * (len(header_inputs) + 3 + len(header_outputs)),
+        ]
     )
+    row_format = (
+        " ".join(["{:>6}"] * len(input_headers))
+        + " | "
+        + " ".join(["{:>6}"] * len(output_headers))
+    )
+    return header, row_format
+
+
+def _format_truth_table(
+    truth_table: List[Dict[str, int]],
+    inputs: List[str],
+    outputs: List[str],
+    bus_info: Dict[str, Dict],
+) -> str:
+    """Format truth table rows for display; needs only the module interface."""
+    lines: List[str] = []
+    _append_truth_table(lines, truth_table, inputs, outputs, bus_info)
+    return "\n".join(lines)
+
+
+def _append_truth_table(
+    lines: List[str],
+    truth_table: List[Dict[str, int]],
+    inputs: List[str],
+    outputs: List[str],
+    bus_info: Dict[str, Dict],
+) -> None:
+    """Append formatted truth table lines; those added before an error are kept."""
+    if not truth_table:
+        lines.append("No truth table data to display.")
+        return
+
+    # Column headers carry bus ranges, e.g. A[7:0]
+    def column_header(name: str) -> str:
+        info = bus_info.get(name)
+        if info and info["width"] > 1:
+            return f"{name}[{info['msb']}:{info['lsb']}]"
+        return name
+
+    header, row_format = _truth_table_layout(
+        tuple(map(column_header, inputs)), tuple(map(column_header, outputs))
+    )
+    lines.append(header)
+    columns = list(inputs) + list(outputs)
+    append = lines.append
+    for row in truth_table:
+        append(row_format.format(*[row[name] for name in columns]))
 
 
 class TruthTableGenerator:
     """Generates and displays truth tables for combinational logic."""
 
-    def __init__(self, evaluator: LogicEvaluator):
+    def __init__(self, evaluator: LogicEvaluator, warnings: Optional[List[str]] = None):
         self.evaluator = evaluator
+        # Warnings are appended here when a list is given, otherwise printed
+        self.warnings = warnings
+
+    def _warn(self, message: str):
+        if self.warnings is None:
+            print(message)
+        else:
+            self.warnings.append(message)
 
     def generate_truth_table(self, max_combinations: int = 256) -> List[Dict[str, int]]:
         """
@@ -2334,7 +2545,7 @@ class TruthTableGenerator:
         # Limit combinations if too many inputs
         total_combinations = 2**total_input_bits
         if total_combinations > max_combinations:
-            print(
+            self._warn(
                 f"Warning: Too many input combinations ({total_combinations}). "
                 f"Limiting to first {max_combinations} combinations."
             )
@@ -2373,46 +2584,16 @@ class TruthTableGenerator:
 
     def print_truth_table(self, truth_table: List[Dict[str, int]]):
         """Print a formatted truth table with proper bus formatting."""
-        if not truth_table:
-            print("No truth table data to display.")
-            return
-
-        inputs = self.evaluator.inputs
-        outputs = self.evaluator.outputs
-        bus_info = self.evaluator.bus_info
-
-        # Create headers with bus information
-        input_headers = []
-        output_headers = []
-
-        for inp in inputs:
-            if inp in bus_info and bus_info[inp]["width"] > 1:
-                width = bus_info[inp]["width"]
-                msb, lsb = bus_info[inp]["msb"], bus_info[inp]["lsb"]
-                input_headers.append(f"{inp}[{msb}:{lsb}]")
-            else:
-                input_headers.append(inp)
-
-        for out in outputs:
-            if out in bus_info and bus_info[out]["width"] > 1:
-                width = bus_info[out]["width"]
-                msb, lsb = bus_info[out]["msb"], bus_info[out]["lsb"]
-                output_headers.append(f"{out}[{msb}:{lsb}]")
-            else:
-                output_headers.append(out)
-
-        # Print header
-        header_inputs = " ".join(f"{header:>6}" for header in input_headers)
-        header_outputs = " ".join(f"{header:>6}" for header in output_headers)
-        print("Truth Table:")
-        print(f"{header_inputs} | {header_outputs}")
-        print("-" * (len(header_inputs) + 3 + len(header_outputs)))
-
-        # Print data rows
-        for row in truth_table:
-            input_values = " ".join(f"{row[inp]:>6}" for inp in inputs)
-            output_values = " ".join(f"{row[out]:>6}" for out in outputs)
-            print(f"{input_values} | {output_values}")
+        print(self.format_truth_table(truth_table))
+
+    def format_truth_table(self, truth_table: List[Dict[str, int]]) -> str:
+        """Format a truth table with proper bus formatting as a single string."""
+        return _format_truth_table(
+            truth_table,
+            self.evaluator.inputs,
+            self.evaluator.outputs,
+            self.evaluator.bus_info,
+        )
 
 
 class TruthTableImageGenerator:
@@ -2956,62 +3137,140 @@ class WaveformImageGenerator:
             draw.text((tx, y_mid - 6), val_s, fill=color, font=self.font_small)
 
 
+# Kinds of entries recorded in TestRunner.test_outputs. Entries are tuples of
+# (kind, label, description, output_name, actual_value, expected_value) and are
+# only turned into text by format_test_output() when a report is printed.
+TEST_PASSED = "passed"
+TEST_MISSING_OUTPUT = "missing"
+TEST_MISMATCH = "mismatch"
+
+
+# JSON test file layouts understood by TestRunner.run_tests()
+TEST_FORMAT_COMBINATIONAL = "combinational"  # list of {inputs..., "expect": {...}}
+TEST_FORMAT_SEQUENTIAL = "sequential"  # {"sequential": true, "test_cases": [...]}
+TEST_FORMAT_LEGACY_SEQUENTIAL = "legacy_sequential"  # {"test_type": "sequential", ...}
+
+
+def classify_test_format(tests: Any) -> str:
+    """Return which TEST_FORMAT_* layout a loaded JSON test file uses."""
+    if isinstance(tests, dict):
+        if tests.get("sequential") or tests.get("test_cases"):
+            return TEST_FORMAT_SEQUENTIAL
+        if tests.get("test_type") == "sequential":
+            return TEST_FORMAT_LEGACY_SEQUENTIAL
+    return TEST_FORMAT_COMBINATIONAL
+
+
+def _intern_keys(obj: Any) -> Any:
+    """Return a copy of loaded JSON with every dict key passed through sys.intern.
+
+    Port names from the parser are interned too, so the per-test expected /
+    actual lookups hit the identity fast path instead of comparing strings.
+    """
+    if isinstance(obj, dict):
+        return {sys.intern(key): _intern_keys(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_keys(item) for item in obj]
+    return obj
+
+
+def format_test_output(entry: Tuple) -> str:
+    """Format one recorded test result line; integer labels are test numbers."""
+    kind, label, description, output_name, actual_value, expected_value = entry
+    if isinstance(label, int):
+        label = f"Test {label}"
+    suffix = f" - {description}" if description else ""
+    if kind == TEST_MISSING_OUTPUT:
+        return f"{label} failed: Output '{output_name}' not found{suffix}"
+    if kind == TEST_MISMATCH:
+        return (
+            f"{label} failed: {output_name} = {actual_value}, "
+            f"expected {expected_value}{suffix}"
+        )
+    return f"{label} passed{suffix}"
+
+
 class TestRunner:
     """Runs test cases from JSON files against the simulator."""
 
-    def __init__(self, evaluator: Any, verbose: bool = True):
+    def __init__(self, evaluator: Any, verbose: bool = True, record_passes: bool = True):
         self.evaluator = evaluator
         self.verbose = verbose
-        self.test_cycles = []  # Store test cycles for waveform generation
-        self.test_outputs = []  # Store per-test pass/fail output for callers
+        self.record_passes = record_passes  # False keeps only failure entries
+        self.is_sequential = hasattr(evaluator, "evaluate_cycle")
+        # Resolve the per-step evaluation call once instead of on every cycle.
+        self._evaluate_step = (
+            evaluator.evaluate_cycle if self.is_sequential else evaluator.evaluate
+        )
+        # Store test cycles for waveform generation. Entries keep the test's own
+        # input dicts and the fresh output dict returned for each cycle, so
+        # nothing is copied per cycle.
+        self.test_cycles = []
+        self.test_outputs = []  # Per-test result entries, see format_test_output()
         self.loaded_test_file = ""
+        self.memory_bindings: List[Dict[str, Any]] = []  # ROM/RAM init files used by the tests
 
-    def _emit(self, message: str, record: bool = True):
-        """Emit output while optionally recording it for silent callers."""
-        if record and message:
-            self.test_outputs.append(message)
+    def _emit(self, entry: Tuple):
+        """Record a test result entry, printing it immediately when verbose."""
         if self.verbose:
-            print(message)
-
-    def _evaluate_inputs(self, input_values: Dict[str, Any]) -> Dict[str, int]:
-        """Evaluate one input set for combinational or sequential designs."""
-        if hasattr(self.evaluator, "evaluate_cycle"):
-            return self.evaluator.evaluate_cycle(input_values)
-        return self.evaluator.evaluate(input_values)
+            print(format_test_output(entry))
+        if self.record_passes or entry[0] != TEST_PASSED:
+            self.test_outputs.append(entry)
 
     def _check_expected_outputs(
         self,
-        label: str,
+        label: Union[int, str],
         actual_outputs: Dict[str, int],
         expected_outputs: Dict[str, Any],
         description: str = "",
         emit_pass: bool = True,
     ) -> bool:
-        """Compare actual outputs to expectations and emit consistent messages."""
-        suffix = f" - {description}" if description else ""
-        test_passed = True
+        """Compare actual outputs to expectations and record the result.
+
+        Stops at the first mismatching output; one failure line per check is
+        enough to mark the test failed.
+        """
+        # Passing checks (the common case) are decided by one subset test of the
+        # item views; only failures walk the outputs to find what differs.
+        if expected_outputs.items() <= actual_outputs.items():
+            if emit_pass:
+                self._emit((TEST_PASSED, label, description, None, None, None))
+            return True
+
         for output_name, expected_value in expected_outputs.items():
             if output_name not in actual_outputs:
                 self._emit(
-                    f"{label} failed: Output '{output_name}' not found{suffix}"
+                    (TEST_MISSING_OUTPUT, label, description, output_name, None, None)
                 )
-                test_passed = False
-            elif actual_outputs[output_name] != expected_value:
+                return False
+            actual_value = actual_outputs[output_name]
+            if actual_value != expected_value:
                 self._emit(
-                    f"{label} failed: {output_name} = {actual_outputs[output_name]}, "
-                    f"expected {expected_value}{suffix}"
+                    (TEST_MISMATCH, label, description, output_name,
+                     actual_value, expected_value)
                 )
-                test_passed = False
+                return False
 
-        if test_passed and emit_pass:
-            self._emit(f"{label} passed{suffix}")
-        return test_passed
+        if emit_pass:
+            self._emit((TEST_PASSED, label, description, None, None, None))
+        return True
 
     def load_tests(self, test_file: str) -> Any:
         """Load test cases from a JSON file."""
         try:
-            with open(test_file, "r", encoding="utf-8") as f:
-                tests = json.load(f)
+            stat = os.stat(test_file)
+            stat_key = (os.path.abspath(test_file), stat.st_mtime_ns, stat.st_size)
+            tests = _TEST_JSON_STAT_CACHE.get(stat_key)
+            if tests is None:
+                # Read the whole file in one call and decode it as a single buffer.
+                with open(test_file, "rb") as f:
+                    data = f.read()
+                key = hashlib.blake2b(data, digest_size=16).digest()
+                tests = _TEST_JSON_CACHE.get(key)
+                if tests is None:
+                    tests = _intern_keys(json.loads(data))
+                    _TEST_JSON_CACHE[key] = tests
+                _TEST_JSON_STAT_CACHE[stat_key] = tests
             self.loaded_test_file = test_file
             return tests
         except FileNotFoundError:
@@ -3036,37 +3295,41 @@ class TestRunner:
         test_dir = os.path.dirname(self.loaded_test_file) if self.loaded_test_file else os.getcwd()
         default_module = getattr(self.evaluator, "module_name", "")
         memory_bindings = normalize_memory_bindings(tests, test_dir, default_module)
+        self.memory_bindings = memory_bindings
         if hasattr(self.evaluator, "configure_memory_bindings"):
             self.evaluator.configure_memory_bindings(memory_bindings)
 
-        # Check if this is the new sequential test format
-        if isinstance(tests, dict) and (tests.get('sequential') or tests.get('test_cases')):
+        test_format = classify_test_format(tests)
+        if test_format == TEST_FORMAT_SEQUENTIAL:
             return self._run_new_sequential_tests(tests)
-        # Check if this is the old sequential test format
-        elif isinstance(tests, dict) and tests.get('test_type') == 'sequential':
+        if test_format == TEST_FORMAT_LEGACY_SEQUENTIAL:
             return self._run_sequential_tests(tests)
-        else:
-            return self._run_combinational_tests(tests)
+        return self._run_combinational_tests(tests)
     
-    def _run_combinational_tests(self, tests: List[Dict[str, Any]]) -> Tuple[int, int]:
-        """Run combinational logic tests (original format)"""
+    def _run_combinational_tests(self, tests: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """Run combinational logic tests (original format)
+
+        Tests are consumed in a single pass, so any iterable of test dicts works.
+        """
         if self.verbose:
             print("\nRunning combinational tests...")
         passed = 0
-        total = len(tests)
+        total = 0
+        evaluate = self.evaluator.evaluate
+        check_outputs = self._check_expected_outputs
 
         for i, test in enumerate(tests, 1):
-            # Extract input values (all keys except 'expect')
-            input_values = {k: v for k, v in test.items() if k != "expect"}
-            expected_outputs = test.get("expect", {})
+            # Extract input values (all keys except 'expect'); copy-then-pop avoids
+            # a per-key filter and leaves the loaded test dict untouched.
+            input_values = test.copy()
+            expected_outputs = input_values.pop("expect", {})
 
             # Run simulation
-            actual_outputs = self.evaluator.evaluate(input_values)
+            actual_outputs = evaluate(input_values)
 
-            if self._check_expected_outputs(
-                f"Test {i}", actual_outputs, expected_outputs
-            ):
+            if check_outputs(i, actual_outputs, expected_outputs):
                 passed += 1
+            total = i
 
         return passed, total
     
@@ -3084,6 +3347,7 @@ class TestRunner:
         
         # Clear previous test cycles
         self.test_cycles = []
+        evaluate_step = self._evaluate_step
         
         for i, cycle_test in enumerate(test_cycles):
             cycle_num = cycle_test.get('cycle', i)
@@ -3092,13 +3356,13 @@ class TestRunner:
             description = cycle_test.get('description', f'Cycle {cycle_num}')
             
             # Run one clock cycle
-            actual_outputs = self._evaluate_inputs(input_values)
+            actual_outputs = evaluate_step(input_values)
             
             # Store cycle data for waveform generation
             self.test_cycles.append({
                 'cycle': cycle_num,
-                'inputs': input_values.copy(),
-                'outputs': actual_outputs.copy(),
+                'inputs': input_values,
+                'outputs': actual_outputs,
                 'description': description
             })
             
@@ -3127,6 +3391,7 @@ class TestRunner:
         # Clear previous test cycles
         self.test_cycles = []
         cycle_counter = 0
+        evaluate_step = self._evaluate_step
         
         for test_case in test_cases:
             name = test_case.get('name', 'Unnamed test')
@@ -3139,13 +3404,13 @@ class TestRunner:
                     expected_outputs = step.get('expected', {})
                     
                     # Run one clock cycle
-                    actual_outputs = self._evaluate_inputs(input_values)
+                    actual_outputs = evaluate_step(input_values)
                     
                     # Store cycle data for waveform generation
                     self.test_cycles.append({
                         'cycle': cycle_counter,
-                        'inputs': input_values.copy(),
-                        'outputs': actual_outputs.copy(),
+                        'inputs': input_values,
+                        'outputs': actual_outputs,
                         'description': f'{name} - Step {cycle_counter}'
                     })
                     cycle_counter += 1
@@ -3159,7 +3424,7 @@ class TestRunner:
                         sequence_passed = False
                 
                 if sequence_passed:
-                    self._emit(f"{name} passed")
+                    self._emit((TEST_PASSED, name, "", None, None, None))
                     passed += 1
                 total += 1
             
@@ -3169,13 +3434,13 @@ class TestRunner:
                 expected_outputs = test_case.get('expected', {})
                 
                 # Run one clock cycle
-                actual_outputs = self._evaluate_inputs(input_values)
+                actual_outputs = evaluate_step(input_values)
                 
                 # Store cycle data for waveform generation
                 self.test_cycles.append({
                     'cycle': cycle_counter,
-                    'inputs': input_values.copy(),
-                    'outputs': actual_outputs.copy(),
+                    'inputs': input_values,
+                    'outputs': actual_outputs,
                     'description': name
                 })
                 cycle_counter += 1
@@ -3193,19 +3458,20 @@ def _check_missing_expect_fields(tests) -> str:
     """Check if any test cases are missing expect/expected fields."""
     missing_count = 0
 
-    if isinstance(tests, dict):
-        if tests.get("test_type") == "sequential":
-            for cycle in tests.get("test_cycles", []):
-                if not cycle.get("expected_outputs"):
-                    missing_count += 1
-        elif tests.get("sequential") or tests.get("test_cases"):
-            for test_case in tests.get("test_cases", []):
-                if "sequence" in test_case:
-                    for step in test_case["sequence"]:
-                        if not step.get("expected"):
-                            missing_count += 1
-                elif not test_case.get("expected"):
-                    missing_count += 1
+    # Classify with the same rules run_tests() dispatches on
+    test_format = classify_test_format(tests)
+    if test_format == TEST_FORMAT_LEGACY_SEQUENTIAL:
+        for cycle in tests.get("test_cycles", []):
+            if not cycle.get("expected_outputs"):
+                missing_count += 1
+    elif test_format == TEST_FORMAT_SEQUENTIAL:
+        for test_case in tests.get("test_cases", []):
+            if "sequence" in test_case:
+                for step in test_case["sequence"]:
+                    if not step.get("expected"):
+                        missing_count += 1
+            elif not test_case.get("expected"):
+                missing_count += 1
     elif isinstance(tests, list):
         for test in tests:
             if not test.get("expect"):
@@ -3216,56 +3482,224 @@ def _check_missing_expect_fields(tests) -> str:
     return ""
 
 
-def _append_warning(existing: str, new_warning: str) -> str:
-    """Append a warning using the existing semicolon-delimited format."""
-    if not new_warning:
-        return existing
-    if existing:
-        return f"{existing}; {new_warning}"
-    return new_warning
+def _directory_listing(directory: str) -> Optional[frozenset]:
+    """Case-folded names in ``directory``, listed once and reused until its mtime changes."""
+    directory = os.path.abspath(directory)
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+    cached = _DIR_LISTING_CACHE.get(directory)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        names = frozenset(name.casefold() for name in os.listdir(directory))
+    except OSError:
+        return None
+    _DIR_LISTING_CACHE[directory] = (mtime_ns, names)
+    return names
 
 
 def _find_json_test_file(sv_file: str) -> Optional[str]:
     """Find the corresponding JSON test file for a SystemVerilog file."""
-    sv_path = Path(sv_file)
-    possible_names = [
-        sv_path.with_suffix(".json"),
-        sv_path.parent / f"{sv_path.stem}_test.json",
-        sv_path.parent / f"{sv_path.stem}_tests.json",
-    ]
-    for json_path in possible_names:
-        if json_path.exists():
-            return str(json_path)
+    # Candidates are screened against one listing of the directory, so a tree
+    # of files costs a listdir per directory rather than a stat per candidate
+    # suffix. The listing is compared case-folded and a match is confirmed
+    # with os.path.exists(), which keeps the filesystem's own case rules
+    # (Windows, default macOS) and skips dangling symlinks.
+    base = os.path.splitext(sv_file)[0]
+    listing = _directory_listing(os.path.dirname(base) or ".")
+    if listing is None:
+        return next(
+            (base + suffix for suffix in JSON_TEST_SUFFIXES if os.path.exists(base + suffix)),
+            None,
+        )
+
+    stem = os.path.basename(base).casefold()
+    for suffix in JSON_TEST_SUFFIXES:
+        if stem + suffix in listing and os.path.exists(base + suffix):
+            return base + suffix
+    return None
+
+
+def _simulator_fingerprint() -> bytes:
+    """Digest of this simulator's source; cached results are only valid for it."""
+    global _SIMULATOR_FINGERPRINT
+    if _SIMULATOR_FINGERPRINT is None:
+        _SIMULATOR_FINGERPRINT = hashlib.blake2b(
+            Path(__file__).read_bytes(), digest_size=16
+        ).digest()
+    return _SIMULATOR_FINGERPRINT
+
+
+def _hierarchy_source_files(
+    evaluator: Any, module_names: Optional[set] = None
+) -> Optional[List[str]]:
+    """List the .sv files a combinational module's behavior depends on.
+
+    Returns None when the hierarchy cannot be cached safely: unresolved
+    modules, ROM primitives, or memories whose contents live outside .sv files.
+    Names of the sub-modules walked are added to ``module_names`` when given.
+    """
+    if getattr(evaluator, "rom_data", None) is not None or evaluator.memory_arrays:
+        return None
+
+    files = [os.path.abspath(evaluator.current_file_path)]
+    pending = [inst["module_type"] for inst in evaluator.instantiations]
+    seen = set() if module_names is None else module_names
+    while pending:
+        module_name = pending.pop()
+        if module_name in seen:
+            continue
+        seen.add(module_name)
+        if module_name not in GLOBAL_MODULE_CACHE:
+            evaluator._load_module(module_name)
+        module_info = GLOBAL_MODULE_CACHE.get(module_name)
+        if not module_info or not module_info.get("filepath"):
+            return None
+        if module_name.startswith("rom_") or module_info.get("memory_arrays"):
+            return None
+        files.append(module_info["filepath"])
+        pending.extend(inst["module_type"] for inst in module_info.get("instantiations", []))
+    return files
+
+
+def _stat_signature(paths: Iterable[str]) -> Dict[str, Optional[List[int]]]:
+    """Map each path to [mtime_ns, size], or None when it does not exist."""
+    signature: Dict[str, Optional[List[int]]] = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature[path] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            signature[path] = None
+    return signature
+
+
+def _report_cache_path(sv_file: str, cache_dir: str, options: Tuple) -> Path:
+    """Cache file for a top-level file's result under one set of run options."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_simulator_fingerprint())
+    # The path as given is part of the key too: it is echoed back in the result
+    digest.update(repr((os.path.abspath(sv_file), sv_file, options)).encode())
+    return Path(cache_dir) / "reports" / f"report-{digest.hexdigest()}.json"
+
+
+def _report_dependencies(
+    evaluator: Any, sv_file: str, extra_files: List[str]
+) -> Optional[List[str]]:
+    """Every path whose presence or contents can change a file's result.
+
+    Besides the resolved hierarchy this includes each place a sub-module or
+    JSON test file *could* be found, so a new file that would shadow or add
+    one invalidates the cached result. ``extra_files`` holds other inputs and
+    outputs (memory init files, the PNG). None means the result is uncacheable.
+    """
+    walker = getattr(evaluator, "comb_evaluator", evaluator)
+    module_names: set = set()
+    source_files = _hierarchy_source_files(walker, module_names)
+    if source_files is None:
+        return None
+
+    paths = set(source_files)
+    for module_name in module_names:
+        paths.update(walker._module_search_paths(module_name))
+    base = os.path.splitext(os.path.abspath(sv_file))[0]
+    paths.update(base + suffix for suffix in JSON_TEST_SUFFIXES)
+    paths.update(os.path.abspath(path) for path in extra_files)
+    return sorted(paths)
+
+
+def _load_cached_report(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Return a stored result if none of its dependencies changed since."""
+    try:
+        entry = json.loads(cache_path.read_bytes())
+        if _stat_signature(entry["dependencies"]) == entry["dependencies"]:
+            return entry["result"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
     return None
 
 
+def _truth_table_cache_path(
+    evaluator: Any, max_combinations: int, cache_dir: str
+) -> Optional[Path]:
+    """Build the cache file path for a module's truth table, or None if uncacheable."""
+    source_files = _hierarchy_source_files(evaluator)
+    if source_files is None:
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_simulator_fingerprint())
+    digest.update(str(max_combinations).encode())
+    for file_path in sorted(set(source_files)):
+        digest.update(file_path.encode())
+        digest.update(Path(file_path).read_bytes())
+    return Path(cache_dir) / f"tt-{digest.hexdigest()}.json"
+
+
 def _generate_truth_table(
-    evaluator: Any, max_combinations: int
+    evaluator: Any,
+    max_combinations: int,
+    is_sequential: bool = False,
+    cache_dir: Optional[str] = None,
 ) -> Tuple[List[Dict[str, int]], bool, str]:
-    """Generate a truth table and capture any warning output."""
+    """Generate a truth table and collect any generator warnings.
+
+    With cache_dir set, rows for unchanged combinational hierarchies are read
+    back from disk instead of being re-simulated.
+    """
     truth_table: List[Dict[str, int]] = []
     truth_table_success = True
     warnings = ""
 
-    if hasattr(evaluator, "evaluate_cycle"):
+    if is_sequential:
         return truth_table, True, "Truth table skipped for sequential logic module"
+    if not evaluator.outputs:
+        # Every row would hold only input values; don't simulate 2**n combinations
+        return truth_table, True, "Truth table skipped: module has no outputs"
+
+    cache_path = None
+    if cache_dir:
+        try:
+            cache_path = _truth_table_cache_path(evaluator, max_combinations, cache_dir)
+            if cache_path is not None and cache_path.exists():
+                cached = json.loads(cache_path.read_bytes())
+                return cached["truth_table"], True, cached["warnings"]
+        except (OSError, ValueError, KeyError):
+            cache_path = None
 
     try:
-        capture = io.StringIO()
-        with contextlib.redirect_stdout(capture):
-            truth_table_gen = TruthTableGenerator(evaluator)
-            truth_table = truth_table_gen.generate_truth_table(max_combinations)
-        warnings = capture.getvalue().strip()
+        warning_lines: List[str] = []
+        truth_table_gen = TruthTableGenerator(evaluator, warnings=warning_lines)
+        truth_table = truth_table_gen.generate_truth_table(max_combinations)
+        warnings = "\n".join(warning_lines)
     except Exception as e:
         truth_table_success = False
         warnings = f"Truth table generation failed: {e}"
 
+    if cache_path is not None and truth_table_success:
+        _write_cache_file(cache_path, {"truth_table": truth_table, "warnings": warnings})
+
     return truth_table, truth_table_success, warnings
 
 
-def _run_json_tests(evaluator: Any, json_file: str) -> Dict[str, Any]:
+def _write_cache_file(cache_path: Path, payload: Any):
+    """Atomically write a JSON cache entry; cache write failures are ignored."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _run_json_tests(
+    evaluator: Any, json_file: str, record_passes: bool = True
+) -> Dict[str, Any]:
     """Run JSON-backed tests using the shared simulator-side test runner."""
-    sim_runner = TestRunner(evaluator, verbose=False)
+    sim_runner = TestRunner(evaluator, verbose=False, record_passes=record_passes)
     tests = sim_runner.load_tests(json_file)
     missing_expect_warning = _check_missing_expect_fields(tests)
     passed_tests, total_tests = sim_runner.run_tests(tests)
@@ -3275,6 +3709,7 @@ def _run_json_tests(evaluator: Any, json_file: str) -> Dict[str, Any]:
         "test_success": passed_tests == total_tests,
         "test_outputs": sim_runner.test_outputs,
         "test_cycles": sim_runner.test_cycles,
+        "memory_files": [binding["file"] for binding in sim_runner.memory_bindings],
         "warning": missing_expect_warning,
     }
 
@@ -3284,11 +3719,12 @@ def _generate_output_image(
     sv_file: str,
     truth_table: List[Dict[str, int]],
     test_cycles: List[Dict[str, Any]],
+    is_sequential: bool = False,
 ) -> Tuple[Optional[str], str]:
     """Generate the PNG artifact associated with a file's results."""
     try:
         png_path = str(Path(sv_file).with_suffix(".png"))
-        if hasattr(evaluator, "evaluate_cycle"):
+        if is_sequential:
             if test_cycles:
                 waveform_gen = WaveformImageGenerator(evaluator)
                 waveform_gen.generate_image(test_cycles, png_path)
@@ -3305,49 +3741,93 @@ def _generate_output_image(
     return None, ""
 
 
-def _analyze_sv_file(sv_file: str, max_combinations: int = 16) -> Dict[str, Any]:
-    """Process one SystemVerilog file into a serializable result payload."""
+def _analyze_sv_file(
+    sv_file: str,
+    max_combinations: int = 16,
+    cache_dir: Optional[str] = None,
+    skip_truth_table: bool = False,
+    failures_only: bool = False,
+    scan_only: bool = False,
+) -> Dict[str, Any]:
+    """Process one SystemVerilog file into a serializable result payload.
+
+    Files are parsed with the process-wide shared parser, and files already
+    parsed this run (as a top-level file or as a sub-module of an earlier one)
+    are reused through parse_file_cached().
+    With scan_only the file is only parsed, elaborated and gate-counted.
+    """
     try:
-        start_time = time.time()
-        clear_module_cache()
-
-        json_file = _find_json_test_file(sv_file)
-        parser = SystemVerilogParser()
-        module_info = parser.parse_file(sv_file)
+        start_time = time.perf_counter()
+        skip_truth_table = skip_truth_table or scan_only
+        report_cache_path = None
+        if cache_dir:
+            report_cache_path = _report_cache_path(
+                sv_file,
+                cache_dir,
+                (max_combinations, skip_truth_table, failures_only, scan_only),
+            )
+            cached = _load_cached_report(report_cache_path)
+            if cached is not None:
+                # file_cost keeps the time measured when the result was computed;
+                # only the displayed time reflects this lookup
+                cached["execution_time"] = time.perf_counter() - start_time
+                cached["module_cache_hits"] = cached["module_cache_misses"] = 0
+                return cached
+
+        prepare_module_cache(sv_file)
+        cache_hits = MODULE_CACHE_STATS["hits"]
+        cache_misses = MODULE_CACHE_STATS["misses"]
+
+        json_file = None if scan_only else _find_json_test_file(sv_file)
+        module_info = parse_file_cached(sv_file)
         evaluator = create_evaluator(module_info, filepath=sv_file, check_submodules=True)
+        is_sequential = hasattr(evaluator, "evaluate_cycle")
         nand_gate_count = evaluator.count_nand_gates()
 
-        truth_table, truth_table_success, warnings = _generate_truth_table(
-            evaluator, max_combinations
-        )
+        if skip_truth_table and not is_sequential:
+            # Requested by the caller, so reported as a status rather than a warning
+            truth_table, truth_table_success, warnings = [], True, ""
+        else:
+            truth_table, truth_table_success, warnings = _generate_truth_table(
+                evaluator, max_combinations, is_sequential, cache_dir
+            )
+        # Collected here and joined once in the existing "; "-delimited format
+        warning_parts = [warnings]
         test_cycles: List[Dict[str, Any]] = []
         passed_tests = 0
         total_tests = 0
         test_success = True
-        test_outputs: List[str] = []
+        test_outputs: List[Tuple] = []
+        memory_files: List[str] = []
         error_message = ""
 
         if json_file:
             try:
-                test_result = _run_json_tests(evaluator, json_file)
+                test_result = _run_json_tests(
+                    evaluator, json_file, record_passes=not failures_only
+                )
                 passed_tests = test_result["passed_tests"]
                 total_tests = test_result["total_tests"]
                 test_success = test_result["test_success"]
                 test_outputs = test_result["test_outputs"]
                 test_cycles = test_result["test_cycles"]
-                warnings = _append_warning(warnings, test_result["warning"])
+                memory_files = test_result["memory_files"]
+                warning_parts.append(test_result["warning"])
             except Exception as e:
                 test_success = False
                 error_message = f"Test execution failed: {e}"
                 test_outputs = []
 
-        png_file, image_warning = _generate_output_image(
-            evaluator, sv_file, truth_table, test_cycles
-        )
-        warnings = _append_warning(warnings, image_warning)
-        execution_time = time.time() - start_time
+        png_file = None
+        if not skip_truth_table:
+            png_file, image_warning = _generate_output_image(
+                evaluator, sv_file, truth_table, test_cycles, is_sequential
+            )
+            warning_parts.append(image_warning)
+        warnings = "; ".join(filter(None, warning_parts))
+        execution_time = time.perf_counter() - start_time
 
-        return {
+        result = {
             "sv_file": sv_file,
             "json_file": json_file,
             "success": truth_table_success and (not json_file or test_success),
@@ -3359,7 +3839,10 @@ def _analyze_sv_file(sv_file: str, max_combinations: int = 16) -> Dict[str, Any]
             "error_message": error_message,
             "truth_table": truth_table,
             "execution_time": execution_time,
+            "file_cost": execution_time,
             "nand_gate_count": nand_gate_count,
+            "module_cache_hits": MODULE_CACHE_STATS["hits"] - cache_hits,
+            "module_cache_misses": MODULE_CACHE_STATS["misses"] - cache_misses,
             "warnings": warnings,
             "test_outputs": test_outputs,
             "inputs": module_info["inputs"],
@@ -3367,8 +3850,18 @@ def _analyze_sv_file(sv_file: str, max_combinations: int = 16) -> Dict[str, Any]
             "bus_info": module_info.get("bus_info", {}),
             "png_file": png_file,
             "module_name": module_info.get("name", Path(sv_file).stem),
-            "is_sequential": hasattr(evaluator, "evaluate_cycle"),
+            "is_sequential": is_sequential,
         }
+        if report_cache_path is not None and not error_message:
+            dependencies = _report_dependencies(
+                evaluator, sv_file, memory_files + ([png_file] if png_file else [])
+            )
+            if dependencies is not None:
+                _write_cache_file(
+                    report_cache_path,
+                    {"dependencies": _stat_signature(dependencies), "result": result},
+                )
+        return result
     except Exception as e:
         return {
             "sv_file": sv_file,
@@ -3394,13 +3887,93 @@ def _analyze_sv_file(sv_file: str, max_combinations: int = 16) -> Dict[str, Any]
         }
 
 
-def test_single_file_standalone(sv_file: str, max_combinations: int = 16):
+def test_single_file_standalone(
+    sv_file: str,
+    max_combinations: int = 16,
+    cache_dir: Optional[str] = None,
+    skip_truth_table: bool = False,
+    failures_only: bool = False,
+) -> "TestReport":
     """Standalone helper used by process workers."""
-    return _analyze_sv_file(sv_file, max_combinations)
+    return TestReport.from_result(
+        _analyze_sv_file(
+            sv_file,
+            max_combinations,
+            cache_dir=cache_dir,
+            skip_truth_table=skip_truth_table,
+            failures_only=failures_only,
+        )
+    )
+
+
+def test_files_standalone(
+    sv_files: List[str],
+    max_combinations: int = 16,
+    cache_dir: Optional[str] = None,
+    skip_truth_table: bool = False,
+    failures_only: bool = False,
+) -> List["TestReport"]:
+    """Process a batch of files in one worker task; reports follow input order."""
+    return [
+        test_single_file_standalone(
+            sv_file, max_combinations, cache_dir, skip_truth_table, failures_only
+        )
+        for sv_file in sv_files
+    ]
+
+
+def _pool_mp_context():
+    """Pick the multiprocessing start method for the batch worker pool.
+
+    Linux keeps fork: the runner is single-threaded when the pool starts and
+    copy-on-write children need no re-import at all. Other POSIX platforms
+    (macOS defaults to spawn) use forkserver with this module preloaded, so
+    each worker forks from an interpreter that has already imported it.
+    Windows only supports spawn.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if sys.platform.startswith("linux") and "fork" in methods:
+        return multiprocessing.get_context("fork")
+    if "forkserver" in methods:
+        ctx = multiprocessing.get_context("forkserver")
+        # "__main__" when run as a script; forkserver then preloads this file
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return multiprocessing.get_context("spawn")
 
 
 class TestReport:
-    """Container for test results and statistics."""
+    """Container for test results and statistics.
+
+    Workers return these directly, so the slots keep each pickled report to
+    its fields and nothing else.
+    """
+
+    __slots__ = (
+        "sv_file",
+        "json_file",
+        "success",
+        "parse_success",
+        "truth_table_success",
+        "test_success",
+        "passed_tests",
+        "total_tests",
+        "error_message",
+        "truth_table",
+        "execution_time",
+        "file_cost",
+        "nand_gate_count",
+        "module_cache_hits",
+        "module_cache_misses",
+        "warnings",
+        "test_outputs",
+        "png_file",
+        "module_name",
+        "is_sequential",
+        "inputs",
+        "outputs",
+        "bus_info",
+    )
 
     def __init__(self, sv_file: str):
         self.sv_file = sv_file
@@ -3413,14 +3986,51 @@ class TestReport:
         self.total_tests = 0
         self.error_message = ""
         self.truth_table = []
-        self.evaluator = None
         self.execution_time = 0.0
+        # Time to test the file without the result cache; used for scheduling
+        self.file_cost = 0.0
         self.nand_gate_count = 0
+        self.module_cache_hits = 0
+        self.module_cache_misses = 0
         self.warnings = ""
         self.test_outputs = []
         self.png_file = None
         self.module_name = Path(sv_file).stem
         self.is_sequential = False
+        # Port lists of the top module; bus widths are only kept when there is a
+        # truth table to print with them
+        self.inputs = []
+        self.outputs = []
+        self.bus_info = {}
+
+    @classmethod
+    def from_result(cls, result_dict: Dict[str, Any]) -> "TestReport":
+        """Build a report from a serializable _analyze_sv_file() result payload."""
+        report = cls(result_dict["sv_file"])
+        report.json_file = result_dict["json_file"]
+        report.success = result_dict["success"]
+        report.parse_success = result_dict["parse_success"]
+        report.truth_table_success = result_dict["truth_table_success"]
+        report.test_success = result_dict["test_success"]
+        report.passed_tests = result_dict["passed_tests"]
+        report.total_tests = result_dict["total_tests"]
+        report.error_message = result_dict["error_message"]
+        report.truth_table = result_dict["truth_table"]
+        report.execution_time = result_dict["execution_time"]
+        report.file_cost = result_dict.get("file_cost", report.execution_time)
+        report.nand_gate_count = result_dict["nand_gate_count"]
+        report.module_cache_hits = result_dict.get("module_cache_hits", 0)
+        report.module_cache_misses = result_dict.get("module_cache_misses", 0)
+        report.warnings = result_dict["warnings"]
+        report.test_outputs = result_dict["test_outputs"]
+        report.png_file = result_dict.get("png_file")
+        report.module_name = result_dict.get("module_name", report.module_name)
+        report.is_sequential = result_dict.get("is_sequential", False)
+        report.inputs = result_dict.get("inputs", [])
+        report.outputs = result_dict.get("outputs", [])
+        if report.truth_table:
+            report.bus_info = result_dict.get("bus_info") or {}
+        return report
 
     @property
     def has_tests(self) -> bool:
@@ -3438,7 +4048,15 @@ class SystemVerilogTestRunner:
 
     def __init__(self, parallel: bool = True, max_workers: Optional[int] = None):
         self.max_combinations = 16
+        # Set to enable the on-disk caches: per-file results, truth tables, and
+        # the measured file times (FILE_COSTS_NAME) used to schedule parallel runs
+        self.cache_dir: Optional[str] = None
+        self.skip_truth_table = False  # Only run JSON tests; no truth tables or images
+        self.failures_only = False  # Only list failing tests in file reports
+        self.scan_only = False  # Only parse and gate-count; no tests or truth tables
         self.continue_on_error = True
+        # Smaller runs are tested in-process; starting workers would cost more
+        self.min_parallel_files = 4
         self.reports: List[TestReport] = []
         self.parallel = parallel
         if max_workers is None:
@@ -3447,6 +4065,40 @@ class SystemVerilogTestRunner:
             self.max_workers = max_workers
         self.run_failed = False
         self.run_failure_message = ""
+        # Worker pool kept alive across run_tests() calls; see _get_pool()/close()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+
+    def __enter__(self) -> "SystemVerilogTestRunner":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down the worker pool, if one was started.
+
+        With wait=False, queued work is cancelled instead of drained.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=not wait)
+            self._pool = None
+            self._pool_workers = 0
+
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Return the runner's worker pool, starting it on first use.
+
+        Workers stay warm between run_tests() calls; the pool is only rebuilt
+        when a later run needs more workers than it was started with.
+        """
+        if self._pool is not None and self._pool_workers < workers:
+            self.close()
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=_pool_mp_context()
+            )
+            self._pool_workers = workers
+        return self._pool
 
     def find_sv_files(self, path: str) -> List[str]:
         """Find all SystemVerilog files in the given path."""
@@ -3455,51 +4107,38 @@ class SystemVerilogTestRunner:
         if path_obj.is_file() and path_obj.suffix == ".sv":
             return [str(path_obj)]
         if path_obj.is_dir():
-            return [str(file_path) for file_path in sorted(path_obj.rglob("*.sv"))]
+            # Walk with scandir so directory checks reuse the readdir entry type
+            # instead of stat()ing every file the way rglob() does.
+            sv_files: List[str] = []
+            stack = [str(path_obj)]
+            while stack:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".sv"):
+                            sv_files.append(entry.path)
+            # Sort by path components to keep the ordering of sorted(Path) objects
+            sv_files.sort(key=lambda file_path: file_path.split(os.sep))
+            return sv_files
         raise ValueError(f"Path '{path}' is not a valid file or directory")
 
     def find_json_test(self, sv_file: str) -> Optional[str]:
         """Find the corresponding JSON test file for a SystemVerilog file."""
         return _find_json_test_file(sv_file)
 
-    def _report_from_result(self, result_dict: Dict[str, Any]) -> TestReport:
-        """Convert a serializable result payload into a TestReport."""
-        report = TestReport(result_dict["sv_file"])
-        report.json_file = result_dict["json_file"]
-        report.success = result_dict["success"]
-        report.parse_success = result_dict["parse_success"]
-        report.truth_table_success = result_dict["truth_table_success"]
-        report.test_success = result_dict["test_success"]
-        report.passed_tests = result_dict["passed_tests"]
-        report.total_tests = result_dict["total_tests"]
-        report.error_message = result_dict["error_message"]
-        report.truth_table = result_dict["truth_table"]
-        report.execution_time = result_dict["execution_time"]
-        report.nand_gate_count = result_dict["nand_gate_count"]
-        report.warnings = result_dict["warnings"]
-        report.test_outputs = result_dict["test_outputs"]
-        report.png_file = result_dict.get("png_file")
-        report.module_name = result_dict.get("module_name", report.module_name)
-        report.is_sequential = result_dict.get("is_sequential", False)
-
-        class DummyEvaluator:
-            def __init__(self, inputs, outputs, bus_info, module_name):
-                self.inputs = inputs
-                self.outputs = outputs
-                self.bus_info = bus_info or {}
-                self.module_name = module_name
-
-        report.evaluator = DummyEvaluator(
-            result_dict.get("inputs", []),
-            result_dict.get("outputs", []),
-            result_dict.get("bus_info", {}),
-            report.module_name,
-        )
-        return report
-
     def test_single_file(self, sv_file: str) -> TestReport:
         """Test a single SystemVerilog file."""
-        return self._report_from_result(_analyze_sv_file(sv_file, self.max_combinations))
+        return TestReport.from_result(
+            _analyze_sv_file(
+                sv_file,
+                self.max_combinations,
+                self.cache_dir,
+                self.skip_truth_table,
+                self.failures_only,
+                self.scan_only,
+            )
+        )
 
     def run_tests(self, path: str) -> None:
         """Run tests for all SystemVerilog files in the given path."""
@@ -3514,16 +4153,28 @@ class SystemVerilogTestRunner:
 
             print(f"Found {len(sv_files)} SystemVerilog file(s) to test\n")
 
-            should_run_parallel = self.parallel and self.max_workers > 1 and len(sv_files) > 1
+            # Scan-only files are just parsed; a pool round-trip would cost more.
+            # This is the run's only worker-mode line; the parallel path prints
+            # its own once it knows how many workers it starts.
+            pool_allowed = self.parallel and not self.scan_only and self.max_workers > 1
+            should_run_parallel = pool_allowed and len(sv_files) >= self.min_parallel_files
+            if pool_allowed and not should_run_parallel:
+                print(
+                    f"Running sequentially: fewer than {self.min_parallel_files} files to test\n"
+                )
+            elif not should_run_parallel:
+                print("Running sequentially\n")
             if should_run_parallel:
                 try:
                     self._run_tests_parallel(sv_files)
                 except Exception as e:
                     print(f"[WARN] Parallel execution unavailable: {e}")
                     print("[INFO] Falling back to sequential execution\n")
-                    self._run_tests_sequential(sv_files)
+                    # Reports are recorded as they are printed; finish the rest
+                    self._run_tests_sequential(sv_files[len(self.reports):])
             else:
                 self._run_tests_sequential(sv_files)
+            self._save_file_costs()
 
         except KeyboardInterrupt:
             self.run_failed = True
@@ -3537,152 +4188,268 @@ class SystemVerilogTestRunner:
 
     def _run_tests_sequential(self, sv_files: List[str]) -> None:
         """Run tests sequentially."""
+        # Bind the per-file calls once; this loop runs for every file in the tree.
+        run_file = self.test_single_file
+        record_report = self.reports.append
+        print_report = self.print_file_report
+        continue_on_error = self.continue_on_error
+
         for sv_file in sv_files:
-            report = self.test_single_file(sv_file)
-            self.reports.append(report)
-            self.print_file_report(report)
+            report = run_file(sv_file)
+            record_report(report)
+            print_report(report)
 
-            if not self.continue_on_error and not report.success:
+            if not continue_on_error and not report.success:
                 print(f"Stopping due to error in: {sv_file}")
                 break
 
     def _run_tests_parallel(self, sv_files: List[str]) -> None:
-        """Run tests in parallel using ProcessPoolExecutor."""
-        print(f"Running tests in parallel with {self.max_workers} workers...\n")
-
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_index = {}
-            for index, sv_file in enumerate(sv_files):
-                future = executor.submit(
-                    test_single_file_standalone, sv_file, self.max_combinations
-                )
-                future_to_index[future] = index
+        """Run tests in parallel using ProcessPoolExecutor.
 
-            reports_by_index = {}
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                sv_file = sv_files[index]
-                try:
-                    reports_by_index[index] = self._report_from_result(future.result())
-                except Exception as e:
-                    error_report = TestReport(sv_file)
-                    error_report.error_message = f"Parallel execution failed: {e}"
-                    reports_by_index[index] = error_report
+        Reports are printed in file order as soon as every earlier file is done,
+        and appended to self.reports as they are printed.
+        """
+        file_count = len(sv_files)
+        reports: List[Optional[TestReport]] = [None] * file_count
+        next_to_print = 0
+
+        def print_ready():
+            nonlocal next_to_print
+            while next_to_print < file_count and reports[next_to_print] is not None:
+                self.print_file_report(reports[next_to_print])
+                self.reports.append(reports[next_to_print])
+                next_to_print += 1
+
+        # Without truth tables, a file with no JSON tests only needs a parse and
+        # a gate count. Those run here while the pool works on the rest, rather
+        # than each paying a worker round-trip.
+        local: List[int] = []
+        pooled = list(range(file_count))
+        if self.skip_truth_table:
+            has_tests = [_find_json_test_file(sv_file) is not None for sv_file in sv_files]
+            local = [index for index in pooled if not has_tests[index]]
+            pooled = [index for index in pooled if has_tests[index]]
+
+        futures = {}
+        try:
+            if pooled:
+                # Never start more worker processes than there are files to test.
+                workers = min(self.max_workers, len(pooled))
+                print(f"Running tests in parallel with {workers} workers...\n")
+                executor = self._get_pool(workers)
+
+                # Schedule the most expensive files first so no large module
+                # starts last and leaves the other workers idle. Batches of
+                # several files save IPC round-trips; striding the cost-sorted
+                # list keeps batches balanced.
+                costs = dict(
+                    zip(pooled, self._estimate_file_costs([sv_files[i] for i in pooled]))
+                )
+                by_cost = sorted(pooled, key=lambda index: -costs[index])
+                batch_count = min(len(pooled), workers * 4)
+                for start in range(batch_count):
+                    batch = by_cost[start::batch_count]
+                    future = executor.submit(
+                        test_files_standalone,
+                        [sv_files[index] for index in batch],
+                        self.max_combinations,
+                        self.cache_dir,
+                        self.skip_truth_table,
+                        self.failures_only,
+                    )
+                    futures[future] = batch
+            else:
+                print("Running sequentially: no files need a worker\n")
+
+            for index in local:
+                reports[index] = self.test_single_file(sv_files[index])
+                print_ready()
+            for future in as_completed(futures):
+                for index, report in zip(futures[future], future.result()):
+                    reports[index] = report
+                print_ready()
+        except BaseException:
+            # File errors are reported inside each result, so anything raised
+            # here is a pool failure; drop the pool before falling back.
+            self.close(wait=False)
+            raise
+
+    def _estimate_file_costs(self, sv_files: List[str]) -> List[float]:
+        """Relative cost per file: last measured time when cached, else file size."""
+        measured: Dict[str, float] = {}
+        if self.cache_dir:
+            try:
+                measured = json.loads(
+                    (Path(self.cache_dir) / FILE_COSTS_NAME).read_bytes()
+                )
+            except (OSError, ValueError):
+                measured = {}
 
-            ordered_reports = []
-            for index in range(len(sv_files)):
-                report = reports_by_index[index]
-                ordered_reports.append(report)
-                self.print_file_report(report)
+        if measured:
+            costs = [measured.get(os.path.abspath(sv_file)) for sv_file in sv_files]
+            if None not in costs:
+                return costs
 
-            self.reports.extend(ordered_reports)
+        # Sizes and times aren't comparable, so any unmeasured file means sizes for all
+        costs = []
+        for sv_file in sv_files:
+            try:
+                costs.append(float(os.path.getsize(sv_file)))
+            except OSError:
+                costs.append(0.0)
+        return costs
+
+    def _save_file_costs(self) -> None:
+        """Record this run's per-file execution times for future scheduling."""
+        if not self.cache_dir or not self.reports:
+            return
+        cost_path = Path(self.cache_dir) / FILE_COSTS_NAME
+        try:
+            costs = json.loads(cost_path.read_bytes())
+        except (OSError, ValueError):
+            costs = {}
+        for report in self.reports:
+            costs[os.path.abspath(report.sv_file)] = report.file_cost
+        _write_cache_file(cost_path, costs)
 
     def print_file_report(self, report: TestReport) -> None:
         """Print a detailed report for a single file."""
-        print("=" * 80)
-        print(f"FILE: {report.sv_file}")
-        print("=" * 80)
+        sys.stdout.write(self.format_file_report(report))
+
+    def format_file_report(self, report: TestReport) -> str:
+        """Format the detailed report for a single file as one block of text."""
+        lines = [
+            "=" * 80,
+            f"FILE: {report.sv_file}",
+            "=" * 80,
+        ]
 
         status = "PASS" if report.success else "FAIL"
-        print(f"Status: [{status}]")
-        print(f"Module: {report.module_name}")
-        print(f"Inputs: {report.evaluator.inputs if report.evaluator else 'N/A'}")
-        print(f"Outputs: {report.evaluator.outputs if report.evaluator else 'N/A'}")
-        print(f"NAND Gates: {report.nand_gate_count}")
-        print(f"Execution Time: {report.execution_time:.3f}s")
+        lines.append(f"Status: [{status}]")
+        lines.append(f"Module: {report.module_name}")
+        lines.append(f"Inputs: {report.inputs}")
+        lines.append(f"Outputs: {report.outputs}")
+        lines.append(f"NAND Gates: {report.nand_gate_count}")
+        lines.append(f"Execution Time: {report.execution_time:.3f}s")
         if report.png_file:
-            print(f"PNG Output: {report.png_file}")
+            lines.append(f"PNG Output: {report.png_file}")
 
-        if report.has_tests:
-            print(f"JSON Test File: {report.json_file}")
-            print(
+        if self.scan_only:
+            lines.append("Test Results: Skipped (--scan-only)")
+        elif report.has_tests:
+            lines.append(f"JSON Test File: {report.json_file}")
+            lines.append(
                 f"Test Results: {report.passed_tests}/{report.total_tests} passed "
                 f"({report.test_pass_rate:.1f}%)"
             )
         else:
-            print("JSON Test File: None")
-            print("Test Results: No tests")
+            lines.append("JSON Test File: None")
+            lines.append("Test Results: No tests")
 
         if report.warnings:
-            print(f"Warnings: {report.warnings}")
+            lines.append(f"Warnings: {report.warnings}")
 
         if report.test_outputs:
-            print("\nTest Execution:")
-            for output in report.test_outputs:
-                print(f"  {output}")
+            lines.append("\nTest Execution:")
+            lines.append("  " + "\n  ".join(map(format_test_output, report.test_outputs)))
 
         if report.error_message:
-            print(f"Error: {report.error_message}")
+            lines.append(f"Error: {report.error_message}")
 
         if report.is_sequential:
-            print("\nTruth Table: Skipped (sequential logic module)")
-        elif report.truth_table and report.truth_table_success and report.evaluator:
-            print()
+            lines.append("\nTruth Table: Skipped (sequential logic module)")
+        elif self.scan_only:
+            lines.append("\nTruth Table: Skipped (--scan-only)")
+        elif self.skip_truth_table:
+            lines.append("\nTruth Table: Skipped (--no-truth-table)")
+        elif report.truth_table and report.truth_table_success:
+            lines.append("")
             try:
-                truth_table_gen = TruthTableGenerator(report.evaluator)
-                truth_table_gen.print_truth_table(report.truth_table)
+                _append_truth_table(
+                    lines, report.truth_table, report.inputs, report.outputs, report.bus_info
+                )
             except Exception as e:
-                print(f"Truth Table Error: {e}")
+                lines.append(f"Truth Table Error: {e}")
         elif report.truth_table_success:
-            print(f"\nTruth Table: {len(report.truth_table)} combinations generated")
+            lines.append(f"\nTruth Table: {len(report.truth_table)} combinations generated")
         else:
-            print("\nTruth Table: Failed to generate")
+            lines.append("\nTruth Table: Failed to generate")
 
-        print()
+        lines.append("")
+        return "\n".join(lines) + "\n"
 
     def print_summary_report(self) -> None:
         """Print summary statistics for the test run."""
+        sys.stdout.write(self.format_summary_report())
+
+    def format_summary_report(self) -> str:
+        """Build the summary report as a single string for one bulk write."""
+        lines: List[str] = []
         total_files = len(self.reports)
         if total_files == 0:
-            print("\nNo files tested.")
+            lines.append("\nNo files tested.")
             if self.run_failed and self.run_failure_message:
-                print(f"Run failure: {self.run_failure_message}")
-            return
-
-        successful_files = sum(1 for report in self.reports if report.success)
-        parse_failures = sum(1 for report in self.reports if not report.parse_success)
-        truth_table_failures = sum(
-            1 for report in self.reports if not report.truth_table_success
-        )
-
-        files_with_tests = sum(1 for report in self.reports if report.has_tests)
-        test_failures = sum(
-            1 for report in self.reports if report.has_tests and not report.test_success
-        )
-        total_test_cases = sum(report.total_tests for report in self.reports)
-        passed_test_cases = sum(report.passed_tests for report in self.reports)
+                lines.append(f"Run failure: {self.run_failure_message}")
+            return "\n".join(lines) + "\n"
+
+        # Tally every statistic in a single pass over the reports.
+        successful_files = parse_failures = truth_table_failures = 0
+        files_with_tests = test_failures = 0
+        total_test_cases = passed_test_cases = total_nand_gates = 0
+        cache_hits = cache_misses = 0
+        total_time = 0.0
+        failed_files: List[TestReport] = []
+        for report in self.reports:
+            if report.success:
+                successful_files += 1
+            else:
+                failed_files.append(report)
+            parse_failures += not report.parse_success
+            truth_table_failures += not report.truth_table_success
+            if report.has_tests:
+                files_with_tests += 1
+                test_failures += not report.test_success
+            total_test_cases += report.total_tests
+            passed_test_cases += report.passed_tests
+            total_time += report.execution_time
+            total_nand_gates += report.nand_gate_count
+            cache_hits += report.module_cache_hits
+            cache_misses += report.module_cache_misses
 
-        total_time = sum(report.execution_time for report in self.reports)
-        total_nand_gates = sum(report.nand_gate_count for report in self.reports)
         avg_nand_gates = total_nand_gates / total_files if total_files > 0 else 0
 
-        print("\n" + "=" * 60)
-        print("SUMMARY REPORT")
-        print("=" * 60)
-        print(f"Files Tested:           {total_files}")
-        print(
+        lines.append("\n" + "=" * 60)
+        lines.append("SUMMARY REPORT")
+        lines.append("=" * 60)
+        lines.append(f"Files Tested:           {total_files}")
+        lines.append(
             f"Overall Success:        {successful_files}/{total_files} "
             f"({successful_files / total_files * 100:.1f}%)"
         )
-        print(f"Parse Failures:         {parse_failures}")
-        print(f"Truth Table Failures:   {truth_table_failures}")
-        print(f"Files with JSON Tests:  {files_with_tests}")
-        print(f"Test Case Failures:     {test_failures}")
-        print(f"Total Test Cases:       {total_test_cases}")
-        print(
+        lines.append(f"Parse Failures:         {parse_failures}")
+        lines.append(f"Truth Table Failures:   {truth_table_failures}")
+        lines.append(f"Files with JSON Tests:  {files_with_tests}")
+        lines.append(f"Test Case Failures:     {test_failures}")
+        lines.append(f"Total Test Cases:       {total_test_cases}")
+        lines.append(
             f"Passed Test Cases:      {passed_test_cases}/{total_test_cases} "
             f"({passed_test_cases / total_test_cases * 100 if total_test_cases > 0 else 0:.1f}%)"
         )
-        print(f"Total Execution Time:   {total_time:.3f}s")
-        print(f"Average Time per File:  {total_time / total_files:.3f}s")
-        print(f"Total NAND Gates:       {total_nand_gates}")
-        print(f"Average NAND per File:  {avg_nand_gates:.1f}")
+        lines.append(f"Total Execution Time:   {total_time:.3f}s")
+        lines.append(f"Average Time per File:  {total_time / total_files:.3f}s")
+        lines.append(f"Total NAND Gates:       {total_nand_gates}")
+        lines.append(f"Average NAND per File:  {avg_nand_gates:.1f}")
+        cache_lookups = cache_hits + cache_misses
+        if cache_lookups:
+            lines.append(
+                f"Module Cache Hits:      {cache_hits}/{cache_lookups} "
+                f"({cache_hits / cache_lookups * 100:.1f}%)"
+            )
         if self.run_failed and self.run_failure_message:
-            print(f"Run Failure:            {self.run_failure_message}")
+            lines.append(f"Run Failure:            {self.run_failure_message}")
 
-        failed_files = [report for report in self.reports if not report.success]
         if failed_files:
-            print(f"\nFailed Files ({len(failed_files)}):")
+            lines.append(f"\nFailed Files ({len(failed_files)}):")
             for report in failed_files:
                 reason = (
                     "Parse error"
@@ -3693,9 +4460,10 @@ class SystemVerilogTestRunner:
                     if report.has_tests and not report.test_success
                     else "Unknown error"
                 )
-                print(f"  [FAIL] {report.sv_file} ({reason})")
+                lines.append(f"  [FAIL] {report.sv_file} ({reason})")
 
-        print("=" * 60)
+        lines.append("=" * 60)
+        return "\n".join(lines) + "\n"
 
 
 def run_simulation(
@@ -3775,6 +4543,10 @@ def run_test_suite(
     sequential: bool = False,
     workers: Optional[int] = None,
     max_combinations: int = 16,
+    use_cache: bool = False,
+    skip_truth_table: bool = False,
+    failures_only: bool = False,
+    scan_only: bool = False,
 ) -> int:
     """Run batch test mode against one file or a directory tree."""
     if not os.path.exists(path):
@@ -3787,20 +4559,30 @@ def run_test_suite(
     parallel = not sequential and (workers is None or workers > 1)
     runner = SystemVerilogTestRunner(parallel=parallel, max_workers=workers)
     runner.max_combinations = max_combinations
+    if use_cache:
+        runner.cache_dir = DEFAULT_CACHE_DIR
+    runner.skip_truth_table = skip_truth_table
+    runner.failures_only = failures_only
+    runner.scan_only = scan_only
 
     print("SystemVerilog Test Runner")
     print("=" * 50)
     print(f"Target: {path}")
-    print(f"Max combinations: {runner.max_combinations}")
-    if parallel:
-        print(f"Parallel processing: {runner.max_workers} workers")
+    if runner.scan_only:
+        print("Scan only: parsing files; no tests or truth tables")
+    elif runner.skip_truth_table:
+        print("Truth tables: disabled")
     else:
-        print("Running sequentially")
+        print(f"Max combinations: {runner.max_combinations}")
+    # run_tests() reports the worker mode once it knows how many files there are
+    if runner.cache_dir:
+        print(f"Result cache: {runner.cache_dir}")
     print()
 
-    start_time = time.time()
-    runner.run_tests(path)
-    end_time = time.time()
+    start_time = time.perf_counter()
+    with runner:
+        runner.run_tests(path)
+    end_time = time.perf_counter()
 
     runner.print_summary_report()
     print(f"\nTotal runtime: {end_time - start_time:.3f}s")
@@ -3826,7 +4608,8 @@ def build_cli_parser() -> argparse.ArgumentParser:
             "  python pysvsim.py --file parts/basic/full_adder.sv\n"
             "  python pysvsim.py --file parts/basic/full_adder.sv --test parts/basic/full_adder.json\n"
             "  python pysvsim.py parts/basic/\n"
-            "  python pysvsim.py parts/basic/and_gate.sv --sequential"
+            "  python pysvsim.py parts/basic/and_gate.sv --sequential\n"
+            "  python pysvsim.py parts/ --jobs 4"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -3849,6 +4632,35 @@ def build_cli_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Clear the global module cache before single-file simulation",
     )
+    parser.add_argument(
+        "--no-truth-table",
+        action="store_true",
+        help=(
+            "Batch mode: only run JSON tests, skipping truth tables and all PNG "
+            "images (truth tables and waveforms)"
+        ),
+    )
+    parser.add_argument(
+        "--scan-only",
+        action="store_true",
+        help=(
+            "Batch mode: only parse and gate-count each file, in-process; "
+            "no tests or truth tables"
+        ),
+    )
+    parser.add_argument(
+        "--failures-only",
+        action="store_true",
+        help="Batch mode: only list failing tests under each file's test execution",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            f"Batch mode: reuse results and truth tables of unchanged files from "
+            f"{DEFAULT_CACHE_DIR}/, and schedule parallel runs by measured file times"
+        ),
+    )
     parser.add_argument(
         "--sequential",
         "-s",
@@ -3858,8 +4670,10 @@ def build_cli_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--workers",
         "-w",
+        "--jobs",
+        "-j",
         type=int,
-        help="Number of parallel workers for batch mode",
+        help="Number of parallel workers for batch mode (default: CPU count - 1)",
     )
     return parser
 
@@ -3886,6 +4700,10 @@ def main(argv: Optional[List[str]] = None) -> int:
             sequential=args.sequential,
             workers=args.workers,
             max_combinations=max_combinations,
+            use_cache=args.cache,
+            skip_truth_table=args.no_truth_table,
+            failures_only=args.failures_only,
+            scan_only=args.scan_only,
         )
 
     parser.error("provide either --file <sv_file> or a file/directory path to batch test")